@@ -1,29 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from models.database import get_db
 from models.job import Job, JobStatus
-from models.schemas import JobCreate, JobUpdate, JobResponse
+from models.schemas import JobCreate, JobUpdate, JobResponse, JobPage
 from scheduler.engine import scheduler_engine
+from scheduler.cache import invalidate_status_counts
+from .pagination import decode_cursor, paginate
 
 router = APIRouter()
 
-@router.get("/", response_model=List[JobResponse])
-def get_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all jobs with pagination"""
-    jobs = db.query(Job).offset(skip).limit(limit).all()
-    return jobs
+# Validates and serializes whole job lists in one pydantic-core pass; list
+# endpoints return the bytes directly so FastAPI skips per-item response validation
+JOB_LIST_ADAPTER = TypeAdapter(List[JobResponse])
+
+def _json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """Wrap pre-serialized JSON in a response"""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+def _not_modified(job: Job, request: Request, response: Response) -> Optional[Response]:
+    """Set the job's ETag, returning a 304 response if the client's copy is current"""
+    # Rows written before updated_at existed fall back to created_at
+    version = job.updated_at or job.created_at
+    etag = f'W/"{job.id}-{int(version.timestamp() * 1_000_000)}"'
+    response.headers["ETag"] = etag
+    if request.headers.get("if-none-match") == etag:
+        # A 304 must repeat the caching headers the full response would carry
+        headers = {"ETag": etag}
+        if "cache-control" in response.headers:
+            headers["Cache-Control"] = response.headers["cache-control"]
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+@router.get("/", response_model=JobPage)
+def get_jobs(cursor: Optional[str] = None, limit: int = Query(100, ge=1), db: Session = Depends(get_db)):
+    """Get all jobs with keyset pagination"""
+    query = db.query(Job).order_by(Job.id)
+    if cursor:
+        query = query.filter(Job.id > decode_cursor(cursor)["id"])
+    jobs, next_cursor = paginate(query, limit)
+    
+    page = JobPage(
+        data=JOB_LIST_ADAPTER.validate_python(jobs, from_attributes=True),
+        next_cursor=next_cursor
+    )
+    return _json_response(page.model_dump_json().encode())
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(job_id: int, db: Session = Depends(get_db)):
+def get_job(job_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a specific job by ID"""
     job = db.query(Job).filter(Job.id == job_id).first()
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    
+    not_modified = _not_modified(job, request, response)
+    if not_modified:
+        return not_modified
     return job
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-def create_job(job: JobCreate, db: Session = Depends(get_db)):
+def create_job(job: JobCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Create a new job"""
     db_job = Job(
         name=job.name,
@@ -35,12 +73,34 @@ def create_job(job: JobCreate, db: Session = Depends(get_db)):
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
+    invalidate_status_counts()
     
-    # Add job to scheduler
-    scheduler_engine.add_job(db_job)
+    # Hand the job to the scheduler loop; the wake-up runs after the response is sent
+    scheduler_engine.enroll(db_job)
+    background_tasks.add_task(scheduler_engine.wake)
     
     return db_job
 
+@router.post("/bulk", response_model=List[JobResponse], status_code=status.HTTP_201_CREATED)
+def create_jobs_bulk(jobs: List[JobCreate], background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Create several jobs with a single INSERT ... RETURNING statement"""
+    if not jobs:
+        return _json_response(b"[]", status.HTTP_201_CREATED)
+    
+    db_jobs = db.scalars(insert(Job).returning(Job, sort_by_parameter_order=True), [job.dict() for job in jobs]).all()
+    # Detach the returned rows so the commit does not expire them and force a reload per job
+    db.expunge_all()
+    db.commit()
+    invalidate_status_counts()
+    
+    # Hand the jobs to the scheduler loop; the wake-up runs after the response is sent
+    for db_job in db_jobs:
+        scheduler_engine.enroll(db_job)
+    background_tasks.add_task(scheduler_engine.wake)
+    
+    created = JOB_LIST_ADAPTER.validate_python(db_jobs, from_attributes=True)
+    return _json_response(JOB_LIST_ADAPTER.dump_json(created), status.HTTP_201_CREATED)
+
 @router.put("/{job_id}", response_model=JobResponse)
 def update_job(job_id: int, job_update: JobUpdate, db: Session = Depends(get_db)):
     """Update an existing job"""
@@ -80,6 +140,7 @@ def delete_job(job_id: int, db: Session = Depends(get_db)):
     # Delete from database
     db.delete(db_job)
     db.commit()
+    invalidate_status_counts()
     
     return None
 
@@ -99,17 +160,24 @@ def cancel_job(job_id: int, db: Session = Depends(get_db)):
     # Update status
     db_job.status = JobStatus.CANCELLED
     db.commit()
+    invalidate_status_counts()
     db.refresh(db_job)
     
     return db_job
 
 @router.get("/status/{job_id}")
-def get_job_status(job_id: int, db: Session = Depends(get_db)):
+def get_job_status(job_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get detailed status of a job"""
     job = db.query(Job).filter(Job.id == job_id).first()
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    # Matches the scheduler status cache TTL
+    response.headers["Cache-Control"] = "private, max-age=1"
+    not_modified = _not_modified(job, request, response)
+    if not_modified:
+        return not_modified
+    
     return {
         "id": job.id,
         "name": job.name,
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+from models.job import Job
+
+def encode_cursor(job: Job) -> str:
+    """Encode the keyset position of a job as an opaque cursor"""
+    payload = {
+        "id": job.id,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str) -> Dict:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        completed_at: Optional[str] = payload.get("completed_at")
+        return {
+            "id": int(payload["id"]),
+            "completed_at": datetime.fromisoformat(completed_at) if completed_at else None
+        }
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def paginate(query: Query, limit: int) -> Tuple[List[Job], Optional[str]]:
+    """Fetch one page from a keyset-ordered query, with the cursor for the next page"""
+    # Fetch one extra row to detect whether there is a next page
+    rows = query.limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1]) if has_next else None
+
+def newest_finished_first(query: Query, cursor: Optional[str]) -> Query:
+    """Order jobs by (completed_at, id) descending and seek past the cursor position"""
+    # Jobs that finished before completed_at was always recorded (e.g. failures from
+    # older databases) have it NULL; they sort last and are paged by id alone
+    query = query.order_by(Job.completed_at.desc().nulls_last(), Job.id.desc())
+    if not cursor:
+        return query
+    
+    position = decode_cursor(cursor)
+    if position["completed_at"] is None:
+        return query.filter(and_(Job.completed_at.is_(None), Job.id < position["id"]))
+    return query.filter(or_(
+        Job.completed_at < position["completed_at"],
+        and_(Job.completed_at == position["completed_at"], Job.id < position["id"]),
+        Job.completed_at.is_(None)
+    ))
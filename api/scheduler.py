@@ -1,29 +1,46 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy import delete, func
 from sqlalchemy.orm import Session
+from typing import Optional
 from models.database import get_db
 from models.job import Job, JobStatus
 from models.schemas import SchedulerStatus
 from scheduler.engine import scheduler_engine
+from scheduler.cache import get_status_counts, set_status_counts, invalidate_status_counts
+from .pagination import newest_finished_first, paginate
 
 router = APIRouter()
 
+def _job_counts(db: Session):
+    """Get job counts by status, served from a short-lived cache between polls"""
+    counts = get_status_counts()
+    if counts is None:
+        # Single grouped query instead of one count per status
+        counts = {job_status: 0 for job_status in JobStatus}
+        counts.update(db.query(Job.status, func.count(Job.id)).group_by(Job.status).all())
+        set_status_counts(counts)
+    return counts
+
+def _finished_jobs_page(db: Session, job_status: JobStatus, cursor: Optional[str], limit: int):
+    """Fetch a page of finished jobs, newest first, keyed on (completed_at, id)"""
+    query = newest_finished_first(db.query(Job).filter(Job.status == job_status), cursor)
+    return paginate(query, limit)
+
 @router.get("/status", response_model=SchedulerStatus)
-def get_scheduler_status(db: Session = Depends(get_db)):
+def get_scheduler_status(response: Response, db: Session = Depends(get_db)):
     """Get current scheduler status"""
+    # Counts are cached server-side for a second anyway
+    response.headers["Cache-Control"] = "private, max-age=1"
     status_info = scheduler_engine.get_status()
     
-    # Get job counts by status
-    active_jobs = db.query(Job).filter(Job.status == JobStatus.RUNNING).count()
-    pending_jobs = db.query(Job).filter(Job.status == JobStatus.PENDING).count()
-    completed_jobs = db.query(Job).filter(Job.status == JobStatus.COMPLETED).count()
-    failed_jobs = db.query(Job).filter(Job.status == JobStatus.FAILED).count()
+    counts = _job_counts(db)
     
     return SchedulerStatus(
         is_running=status_info["is_running"],
-        active_jobs=active_jobs,
-        pending_jobs=pending_jobs,
-        completed_jobs=completed_jobs,
-        failed_jobs=failed_jobs,
+        active_jobs=counts[JobStatus.RUNNING],
+        pending_jobs=counts[JobStatus.PENDING],
+        completed_jobs=counts[JobStatus.COMPLETED],
+        failed_jobs=counts[JobStatus.FAILED],
         current_algorithm=None  # Could be enhanced to show current algorithm
     )
 
@@ -77,10 +94,10 @@ def get_pending_jobs(db: Session = Depends(get_db)):
     ]
 
 @router.get("/jobs/completed")
-def get_completed_jobs(skip: int = 0, limit: int = 50, db: Session = Depends(get_db)):
+def get_completed_jobs(cursor: Optional[str] = None, limit: int = Query(50, ge=1), db: Session = Depends(get_db)):
     """Get recently completed jobs"""
-    completed_jobs = db.query(Job).filter(Job.status == JobStatus.COMPLETED).order_by(Job.completed_at.desc()).offset(skip).limit(limit).all()
-    return [
+    completed_jobs, next_cursor = _finished_jobs_page(db, JobStatus.COMPLETED, cursor, limit)
+    data = [
         {
             "id": job.id,
             "name": job.name,
@@ -91,12 +108,13 @@ def get_completed_jobs(skip: int = 0, limit: int = 50, db: Session = Depends(get
         }
         for job in completed_jobs
     ]
+    return {"data": data, "next_cursor": next_cursor}
 
 @router.get("/jobs/failed")
-def get_failed_jobs(skip: int = 0, limit: int = 50, db: Session = Depends(get_db)):
+def get_failed_jobs(cursor: Optional[str] = None, limit: int = Query(50, ge=1), db: Session = Depends(get_db)):
     """Get failed jobs"""
-    failed_jobs = db.query(Job).filter(Job.status == JobStatus.FAILED).order_by(Job.completed_at.desc()).offset(skip).limit(limit).all()
-    return [
+    failed_jobs, next_cursor = _finished_jobs_page(db, JobStatus.FAILED, cursor, limit)
+    data = [
         {
             "id": job.id,
             "name": job.name,
@@ -107,13 +125,19 @@ def get_failed_jobs(skip: int = 0, limit: int = 50, db: Session = Depends(get_db
         }
         for job in failed_jobs
     ]
+    return {"data": data, "next_cursor": next_cursor}
 
 @router.post("/jobs/clear-completed")
 def clear_completed_jobs(db: Session = Depends(get_db)):
     """Clear all completed jobs"""
     try:
-        deleted_count = db.query(Job).filter(Job.status == JobStatus.COMPLETED).delete()
+        # Single server-side DELETE; no need to sync the identity map of a request-scoped session
+        result = db.execute(
+            delete(Job).where(Job.status == JobStatus.COMPLETED).execution_options(synchronize_session=False)
+        )
+        deleted_count = result.rowcount
         db.commit()
+        invalidate_status_counts()
         return {"message": f"Cleared {deleted_count} completed jobs"}
     except Exception as e:
         db.rollback()
@@ -123,8 +147,13 @@ def clear_completed_jobs(db: Session = Depends(get_db)):
 def clear_failed_jobs(db: Session = Depends(get_db)):
     """Clear all failed jobs"""
     try:
-        deleted_count = db.query(Job).filter(Job.status == JobStatus.FAILED).delete()
+        # Single server-side DELETE; no need to sync the identity map of a request-scoped session
+        result = db.execute(
+            delete(Job).where(Job.status == JobStatus.FAILED).execution_options(synchronize_session=False)
+        )
+        deleted_count = result.rowcount
         db.commit()
+        invalidate_status_counts()
         return {"message": f"Cleared {deleted_count} failed jobs"}
     except Exception as e:
         db.rollback()
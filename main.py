@@ -1,8 +1,10 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 from models.database import engine, get_db
-from models.job import Base
+from models.job import Base, Job
 from api.jobs import router as jobs_router
 from api.scheduler import router as scheduler_router
 from scheduler.engine import scheduler_engine
@@ -11,11 +13,20 @@ import uvicorn
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+# create_all skips tables that already exist, so add any columns and indexes missing from older databases
+if "updated_at" not in {column["name"] for column in inspect(engine).get_columns("jobs")}:
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE jobs ADD COLUMN updated_at DATETIME"))
+
+for index in Job.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
+
 # Create FastAPI app
 app = FastAPI(
     title="Task Scheduler API",
     description="A Python-based task scheduler with multiple scheduling algorithms",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -8,7 +8,13 @@ DATABASE_URL = "sqlite:///./task_scheduler.db"
 
 # Create engine
 engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    # Sized for bursts of concurrent API requests plus the scheduler's executor threads
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=3600
 )
 
 # Create SessionLocal class
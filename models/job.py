@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, Index
 from sqlalchemy.sql import func
+from datetime import datetime, timezone
 from .database import Base
 import enum
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class JobStatus(enum.Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -22,12 +26,23 @@ class Job(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     description = Column(Text, nullable=True)
-    priority = Column(Integer, default=1)
+    priority = Column(Integer, default=1, index=True)
     execution_time = Column(Integer)  # in seconds
-    algorithm = Column(Enum(SchedulingAlgorithm), default=SchedulingAlgorithm.FIFO)
+    algorithm = Column(Enum(SchedulingAlgorithm), default=SchedulingAlgorithm.FIFO, index=True)
     status = Column(Enum(JobStatus), default=JobStatus.PENDING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     result = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
+    # Set from Python rather than func.now() so it keeps sub-second precision on SQLite,
+    # since it versions the job for HTTP ETags
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+    # status is not indexed on its own: each composite index below leads with it
+    __table_args__ = (
+        # Keyset pagination over finished jobs: WHERE status = ? ORDER BY completed_at, id
+        Index("ix_jobs_status_completed", "status", "completed_at", "id"),
+        Index("ix_jobs_status_priority", "status", "priority"),
+        Index("ix_jobs_status_id", "status", "id"),
+    )
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from .job import JobStatus, SchedulingAlgorithm
 
@@ -32,6 +32,10 @@ class JobResponse(JobBase):
     class Config:
         from_attributes = True
 
+class JobPage(BaseModel):
+    data: List[JobResponse]
+    next_cursor: Optional[str] = None
+
 class SchedulerStatus(BaseModel):
     is_running: bool
     active_jobs: int
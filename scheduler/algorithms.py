@@ -1,7 +1,8 @@
 import heapq
+import itertools
 import time
-from typing import List, Optional, Callable
-from queue import Queue, PriorityQueue
+from collections import deque
+from typing import Dict, List, Optional, Callable
 from models.job import Job, JobStatus, SchedulingAlgorithm
 from datetime import datetime
 
@@ -9,12 +10,13 @@ class BaseScheduler:
     """Base class for all scheduling algorithms"""
     
     def __init__(self):
-        self.jobs = []
+        # Pending jobs keyed by id, for O(1) membership checks and removal
+        self.jobs: Dict[int, Job] = {}
         self.current_job = None
         
     def add_job(self, job: Job):
         """Add a job to the scheduler"""
-        self.jobs.append(job)
+        self.jobs[job.id] = job
         
     def get_next_job(self) -> Optional[Job]:
         """Get the next job to execute"""
@@ -22,30 +24,32 @@ class BaseScheduler:
         
     def remove_job(self, job: Job):
         """Remove a job from the scheduler"""
-        if job in self.jobs:
-            self.jobs.remove(job)
+        self.jobs.pop(job.id, None)
 
 class FIFOScheduler(BaseScheduler):
-    """First In, First Out scheduler using a simple queue"""
+    """First In, First Out scheduler using a deque"""
     
     def __init__(self):
         super().__init__()
-        self.queue = Queue()
+        self.queue = deque()
         
     def add_job(self, job: Job):
         """Add job to FIFO queue"""
-        self.queue.put(job)
+        super().add_job(job)
+        self.queue.append(job)
         
     def get_next_job(self) -> Optional[Job]:
         """Get next job from queue (FIFO order)"""
-        if not self.queue.empty():
-            return self.queue.get()
+        if self.queue:
+            job = self.queue.popleft()
+            self.jobs.pop(job.id, None)
+            return job
         return None
         
     def remove_job(self, job: Job):
-        """Remove job from queue (not efficient for FIFO)"""
-        # For FIFO, we typically don't remove jobs from middle
-        pass
+        """Remove job from queue (O(n) rebuild of the deque)"""
+        super().remove_job(job)
+        self.queue = deque(queued for queued in self.queue if queued.id != job.id)
 
 class RoundRobinScheduler(BaseScheduler):
     """Round Robin scheduler with time quantum"""
@@ -53,21 +57,23 @@ class RoundRobinScheduler(BaseScheduler):
     def __init__(self, time_quantum: int = 10):
         super().__init__()
         self.time_quantum = time_quantum
-        self.queue = Queue()
+        self.queue = deque()
         self.current_job = None
         self.remaining_time = 0
         
     def add_job(self, job: Job):
         """Add job to round robin queue"""
-        self.queue.put(job)
+        super().add_job(job)
+        self.queue.append(job)
         
     def get_next_job(self) -> Optional[Job]:
         """Get next job with time quantum consideration"""
-        if self.current_job and self.remaining_time > 0:
-            return self.current_job
-            
-        if not self.queue.empty():
-            self.current_job = self.queue.get()
+        # Each call hands out a new job: the engine runs a dispatched job to
+        # completion, so the current job is never resumed from here. A caller
+        # that preempts it re-queues it through update_remaining_time.
+        if self.queue:
+            self.current_job = self.queue.popleft()
+            self.jobs.pop(self.current_job.id, None)
             self.remaining_time = min(self.time_quantum, self.current_job.execution_time)
             return self.current_job
             
@@ -80,45 +86,73 @@ class RoundRobinScheduler(BaseScheduler):
             # Job completed or time quantum expired
             if self.current_job.execution_time > 0:
                 # Job not completed, add back to queue
-                self.queue.put(self.current_job)
+                self.add_job(self.current_job)
+            self.current_job = None
+            
+    def remove_job(self, job: Job):
+        """Remove job from queue and drop it if it holds the current time slice"""
+        super().remove_job(job)
+        self.queue = deque(queued for queued in self.queue if queued.id != job.id)
+        if self.current_job and self.current_job.id == job.id:
             self.current_job = None
+            self.remaining_time = 0
 
-class SJFScheduler(BaseScheduler):
-    """Shortest Job First scheduler using priority queue"""
+class HeapScheduler(BaseScheduler):
+    """Base class for schedulers backed by a binary heap"""
     
     def __init__(self):
         super().__init__()
-        self.priority_queue = PriorityQueue()
+        # Callers already serialize access via SchedulerEngine.lock, so a plain
+        # heap avoids PriorityQueue's redundant internal locking
+        self.heap = []
+        self._counter = itertools.count()
+        # Live heap entry per job id; removal blanks the entry in place (lazy
+        # deletion) instead of rebuilding the heap
+        self._entries: Dict[int, list] = {}
+        
+    def sort_key(self, job: Job):
+        """Key ordering jobs in the heap, lowest first"""
+        raise NotImplementedError
         
     def add_job(self, job: Job):
-        """Add job to priority queue (execution_time as priority)"""
-        # Lower execution time = higher priority
-        self.priority_queue.put((job.execution_time, job.id, job))
+        """Add job to heap, replacing any existing entry for it"""
+        self.remove_job(job)
+        super().add_job(job)
+        # The counter breaks ties in arrival order so jobs are never compared
+        entry = [self.sort_key(job), next(self._counter), job]
+        self._entries[job.id] = entry
+        heapq.heappush(self.heap, entry)
         
     def get_next_job(self) -> Optional[Job]:
-        """Get job with shortest execution time"""
-        if not self.priority_queue.empty():
-            return self.priority_queue.get()[2]  # Return the job object
+        """Pop the lowest-keyed job, skipping removed entries"""
+        while self.heap:
+            job = heapq.heappop(self.heap)[2]
+            if job is not None:
+                del self._entries[job.id]
+                self.jobs.pop(job.id, None)
+                return job
         return None
+        
+    def remove_job(self, job: Job):
+        """Mark the job's heap entry as removed"""
+        super().remove_job(job)
+        entry = self._entries.pop(job.id, None)
+        if entry is not None:
+            entry[2] = None
 
-class PriorityScheduler(BaseScheduler):
-    """Priority-based scheduler using priority queue"""
+class SJFScheduler(HeapScheduler):
+    """Shortest Job First scheduler"""
     
-    def __init__(self):
-        super().__init__()
-        self.priority_queue = PriorityQueue()
-        
-    def add_job(self, job: Job):
-        """Add job to priority queue (priority as key)"""
-        # Higher priority = lower number (higher priority)
-        # Use negative priority so higher priority jobs come first
-        self.priority_queue.put((-job.priority, job.id, job))
-        
-    def get_next_job(self) -> Optional[Job]:
-        """Get job with highest priority"""
-        if not self.priority_queue.empty():
-            return self.priority_queue.get()[2]  # Return the job object
-        return None
+    def sort_key(self, job: Job):
+        """Lower execution time = higher priority"""
+        return job.execution_time
+
+class PriorityScheduler(HeapScheduler):
+    """Priority-based scheduler"""
+    
+    def sort_key(self, job: Job):
+        """Use negative priority so higher priority jobs come first"""
+        return -job.priority
 
 class SchedulerFactory:
     """Factory class to create scheduler instances"""
@@ -0,0 +1,25 @@
+import threading
+from typing import Dict, Optional
+from cachetools import TTLCache
+from models.job import JobStatus
+
+# Job counts by status, shared by /scheduler/status polls. Short TTL bounds
+# staleness; job status transitions also invalidate it explicitly.
+_STATUS_COUNTS_KEY = "status_counts"
+_status_counts_cache = TTLCache(maxsize=1, ttl=1.0)
+_status_counts_lock = threading.Lock()
+
+def get_status_counts() -> Optional[Dict[JobStatus, int]]:
+    """Return cached job counts by status, or None if absent or expired"""
+    with _status_counts_lock:
+        return _status_counts_cache.get(_STATUS_COUNTS_KEY)
+
+def set_status_counts(counts: Dict[JobStatus, int]):
+    """Cache job counts by status"""
+    with _status_counts_lock:
+        _status_counts_cache[_STATUS_COUNTS_KEY] = counts
+
+def invalidate_status_counts():
+    """Drop cached job counts after a job changes status"""
+    with _status_counts_lock:
+        _status_counts_cache.clear()
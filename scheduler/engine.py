@@ -1,12 +1,14 @@
+import queue
 import threading
-import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional
-from datetime import datetime
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from sqlalchemy import update
 from models.job import Job, JobStatus, SchedulingAlgorithm
 from models.database import SessionLocal
 from .algorithms import SchedulerFactory, RoundRobinScheduler
+from .cache import invalidate_status_counts
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,54 +17,74 @@ logger = logging.getLogger(__name__)
 class JobExecutor:
     """Handles the execution of individual jobs"""
     
-    def __init__(self, job: Job, db: Session):
+    def __init__(self, job: Job, pool: ThreadPoolExecutor):
         self.job = job
-        self.db = db
-        self.thread = None
+        self.pool = pool
+        self.future: Optional[Future] = None
         self.is_running = False
+        self._stop_evt = threading.Event()
         
     def execute(self):
-        """Execute the job in a separate thread"""
+        """Submit the job to the executor thread pool"""
         self.is_running = True
-        self.thread = threading.Thread(target=self._run_job)
-        self.thread.start()
+        self.future = self.pool.submit(self._run_job)
+        
+    def _update_job(self, **values):
+        """Write job fields in a short-lived session so no connection is held while the job runs"""
+        with SessionLocal() as db:
+            # Single UPDATE statement, skipping the ORM load and dirty-attribute flush.
+            # Matches no rows if the job was deleted while it was running.
+            db.execute(
+                update(Job)
+                .where(Job.id == self.job.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        invalidate_status_counts()
         
     def _run_job(self):
         """Internal method to run the job"""
         try:
             # Update job status to running
-            self.job.status = JobStatus.RUNNING
-            self.job.started_at = datetime.now()
-            self.db.commit()
+            self._update_job(status=JobStatus.RUNNING, started_at=datetime.now(timezone.utc))
             
             logger.info(f"Starting job {self.job.id}: {self.job.name}")
             
-            # Simulate job execution
-            time.sleep(self.job.execution_time)
+            # Simulate job execution; returns early if stop() is called
+            if self._stop_evt.wait(self.job.execution_time):
+                self._update_job(status=JobStatus.CANCELLED)
+                logger.info(f"Stopped job {self.job.id}: {self.job.name}")
+                return
             
             # Update job status to completed
-            self.job.status = JobStatus.COMPLETED
-            self.job.completed_at = datetime.now()
-            self.job.result = f"Job {self.job.name} completed successfully"
-            self.db.commit()
+            self._update_job(
+                status=JobStatus.COMPLETED,
+                completed_at=datetime.now(timezone.utc),
+                result=f"Job {self.job.name} completed successfully"
+            )
             
             logger.info(f"Completed job {self.job.id}: {self.job.name}")
             
         except Exception as e:
             # Update job status to failed
-            self.job.status = JobStatus.FAILED
-            self.job.error_message = str(e)
-            self.db.commit()
+            try:
+                self._update_job(status=JobStatus.FAILED, completed_at=datetime.now(timezone.utc), error_message=str(e))
+            except Exception as update_error:
+                logger.error(f"Failed to record failure of job {self.job.id}: {update_error}")
             logger.error(f"Failed job {self.job.id}: {self.job.name} - {e}")
             
         finally:
             self.is_running = False
             
     def stop(self):
-        """Stop the job execution"""
+        """Stop the job execution and wait for it to wind down"""
         self.is_running = False
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1)
+        self._stop_evt.set()
+        if self.future:
+            # Cancel outright if not started yet, otherwise the wait above returns at once
+            self.future.cancel()
+            wait([self.future])
 
 class SchedulerEngine:
     """Main scheduler engine that manages job execution with multithreading"""
@@ -72,7 +94,14 @@ class SchedulerEngine:
         self.schedulers: Dict[SchedulingAlgorithm, object] = {}
         self.active_executors: Dict[int, JobExecutor] = {}
         self.scheduler_thread = None
-        self.lock = threading.Lock()
+        self.max_concurrent_jobs = 3  # Limit concurrent jobs
+        self.pool: Optional[ThreadPoolExecutor] = None
+        # Reentrant so future callbacks that fire synchronously under the lock can notify
+        self.lock = threading.RLock()
+        # Wakes the scheduler loop when a job is added or a slot frees up
+        self.cv = threading.Condition(self.lock)
+        # Jobs handed over by the API without taking the lock; drained by the scheduler loop
+        self.enroll_q: "queue.SimpleQueue[Job]" = queue.SimpleQueue()
         
     def start(self):
         """Start the scheduler engine"""
@@ -81,39 +110,68 @@ class SchedulerEngine:
             return
             
         self.is_running = True
+        self.pool = ThreadPoolExecutor(max_workers=self.max_concurrent_jobs, thread_name_prefix="jobexec")
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop)
         self.scheduler_thread.start()
         logger.info("Scheduler engine started")
         
     def stop(self):
         """Stop the scheduler engine"""
-        self.is_running = False
-        
-        # Stop all active executors
-        with self.lock:
+        # Stop all active executors and wake the loop so it exits
+        with self.cv:
+            self.is_running = False
             for executor in self.active_executors.values():
                 executor.stop()
             self.active_executors.clear()
+            self.cv.notify_all()
             
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
             
+        if self.pool:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+            
         logger.info("Scheduler engine stopped")
         
     def add_job(self, job: Job):
         """Add a job to the appropriate scheduler"""
-        with self.lock:
-            if job.algorithm not in self.schedulers:
-                self.schedulers[job.algorithm] = SchedulerFactory.create_scheduler(job.algorithm)
+        with self.cv:
+            self._drain_enrollments_locked()
+            self._add_job_locked(job)
+            self.cv.notify()
             
-            self.schedulers[job.algorithm].add_job(job)
-            logger.info(f"Added job {job.id} to {job.algorithm.value} scheduler")
+    def enroll(self, job: Job):
+        """Queue a new job for the scheduler loop to add; never blocks on the engine lock"""
+        self.enroll_q.put(job)
+        
+    def _add_job_locked(self, job: Job):
+        """Add a job to its algorithm's scheduler; caller must hold self.lock"""
+        if job.algorithm not in self.schedulers:
+            self.schedulers[job.algorithm] = SchedulerFactory.create_scheduler(job.algorithm)
+        
+        self.schedulers[job.algorithm].add_job(job)
+        logger.info(f"Added job {job.id} to {job.algorithm.value} scheduler")
+        
+    def _drain_enrollments_locked(self):
+        """Move jobs queued by enroll() into their schedulers; caller must hold self.lock"""
+        while True:
+            try:
+                job = self.enroll_q.get_nowait()
+            except queue.Empty:
+                return
+            self._add_job_locked(job)
             
     def remove_job(self, job: Job):
         """Remove a job from the scheduler"""
         with self.lock:
-            if job.algorithm in self.schedulers:
-                self.schedulers[job.algorithm].remove_job(job)
+            # A job created moments ago may still be queued for enrollment
+            self._drain_enrollments_locked()
+            # Look the job up by id in every scheduler: update_job changes job.algorithm
+            # before calling this, so the job may be held under its previous algorithm
+            for scheduler in self.schedulers.values():
+                if job.id in scheduler.jobs:
+                    scheduler.remove_job(job)
                 
             # If job is currently executing, stop it
             if job.id in self.active_executors:
@@ -123,6 +181,7 @@ class SchedulerEngine:
     def get_status(self) -> Dict:
         """Get current scheduler status"""
         with self.lock:
+            self._drain_enrollments_locked()
             active_count = len(self.active_executors)
             pending_count = sum(len(scheduler.jobs) for scheduler in self.schedulers.values())
             
@@ -133,56 +192,73 @@ class SchedulerEngine:
                 "schedulers": {algo.value: len(scheduler.jobs) for algo, scheduler in self.schedulers.items()}
             }
             
+    def wake(self):
+        """Wake the scheduler loop"""
+        with self.cv:
+            self.cv.notify()
+            
     def _scheduler_loop(self):
         """Main scheduler loop that runs in a separate thread"""
-        while self.is_running:
-            try:
-                self._process_jobs()
-                time.sleep(1)  # Check for new jobs every second
-            except Exception as e:
-                logger.error(f"Error in scheduler loop: {e}")
-                time.sleep(5)  # Wait longer on error
-                
-    def _process_jobs(self):
-        """Process jobs from all schedulers"""
-        with self.lock:
-            # Check for completed jobs
-            completed_jobs = []
-            for job_id, executor in self.active_executors.items():
-                if not executor.is_running:
-                    completed_jobs.append(job_id)
+        with self.cv:
+            while self.is_running:
+                try:
+                    started = self._process_jobs_locked()
+                except Exception as e:
+                    logger.error(f"Error in scheduler loop: {e}")
+                    started = False
                     
-            # Remove completed jobs
-            for job_id in completed_jobs:
-                del self.active_executors[job_id]
+                # Keep filling free slots; otherwise sleep until a job is added or finishes.
+                # The timeout is only a safety net against missed notifications.
+                if not started and self.is_running:
+                    self.cv.wait(timeout=5.0)
                 
-            # Start new jobs if we have capacity
-            max_concurrent_jobs = 3  # Limit concurrent jobs
-            if len(self.active_executors) < max_concurrent_jobs:
-                self._start_next_job()
+    def _process_jobs_locked(self) -> bool:
+        """Process jobs from all schedulers; caller must hold self.lock"""
+        # Enroll jobs queued by the API
+        self._drain_enrollments_locked()
+        
+        # Check for completed jobs
+        completed_jobs = []
+        for job_id, executor in self.active_executors.items():
+            if not executor.is_running:
+                completed_jobs.append(job_id)
+                
+        # Remove completed jobs
+        for job_id in completed_jobs:
+            del self.active_executors[job_id]
+            
+        # Start new jobs if we have capacity
+        if len(self.active_executors) < self.max_concurrent_jobs:
+            return self._start_next_job()
+        return False
                 
-    def _start_next_job(self):
-        """Start the next available job"""
+    def _start_next_job(self) -> bool:
+        """Start the next available job, returning whether one was started"""
         db = SessionLocal()
         try:
-            # Try to get a job from each scheduler
+            # Try to get a job from each scheduler, discarding stale entries
+            # (deleted or no longer pending) until one is runnable
             for algorithm, scheduler in self.schedulers.items():
-                job = scheduler.get_next_job()
-                if job:
-                    # Check if job is still pending
-                    db.refresh(job)
-                    if job.status == JobStatus.PENDING:
+                while True:
+                    job = scheduler.get_next_job()
+                    if job is None:
+                        break
+                    # Check if job still exists and is pending
+                    job = db.get(Job, job.id)
+                    if job and job.status == JobStatus.PENDING:
                         # Create executor and start job
-                        executor = JobExecutor(job, db)
+                        executor = JobExecutor(job, self.pool)
                         self.active_executors[job.id] = executor
                         executor.execute()
+                        executor.future.add_done_callback(lambda _: self.wake())
                         logger.info(f"Started job {job.id} with {algorithm.value} algorithm")
-                        break
+                        return True
                         
         except Exception as e:
             logger.error(f"Error starting job: {e}")
         finally:
             db.close()
+        return False
 
 # Global scheduler engine instance
 scheduler_engine = SchedulerEngine()
@@ -4,142 +4,128 @@ Test script for the Task Scheduler
 Demonstrates different scheduling algorithms
 """
 
-import requests
-import time
-import json
-from datetime import datetime
+import asyncio
+import httpx
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
-def create_job(name, priority, execution_time, algorithm):
-    """Create a new job"""
-    job_data = {
-        "name": name,
-        "description": f"Test job for {algorithm} algorithm",
-        "priority": priority,
-        "execution_time": execution_time,
-        "algorithm": algorithm
-    }
-    
-    response = requests.post(f"{BASE_URL}/jobs", json=job_data)
-    if response.status_code == 201:
-        return response.json()
-    else:
-        print(f"Failed to create job: {response.text}")
-        return None
+async def create_jobs(client, jobs):
+    """Create several jobs in one request"""
+    jobs_data = [
+        {
+            "name": name,
+            "description": f"Test job for {algorithm} algorithm",
+            "priority": priority,
+            "execution_time": execution_time,
+            "algorithm": algorithm
+        }
+        for name, priority, execution_time, algorithm in jobs
+    ]
 
-def get_jobs():
-    """Get all jobs"""
-    response = requests.get(f"{BASE_URL}/jobs")
-    if response.status_code == 200:
+    response = await client.post("/jobs/bulk", json=jobs_data)
+    if response.status_code == 201:
         return response.json()
     else:
-        print(f"Failed to get jobs: {response.text}")
+        print(f"Failed to create jobs: {response.text}")
         return []
 
-def get_scheduler_status():
+async def get_jobs(client):
+    """Get all jobs, following pagination cursors"""
+    jobs = []
+    params = {}
+    while True:
+        response = await client.get("/jobs/", params=params)
+        if response.status_code != 200:
+            print(f"Failed to get jobs: {response.text}")
+            return jobs
+        page = response.json()
+        jobs.extend(page["data"])
+        if page["next_cursor"] is None:
+            return jobs
+        params = {"cursor": page["next_cursor"]}
+
+async def get_scheduler_status(client):
     """Get scheduler status"""
-    response = requests.get(f"{BASE_URL}/scheduler/status")
+    response = await client.get("/scheduler/status")
     if response.status_code == 200:
         return response.json()
     else:
         print(f"Failed to get scheduler status: {response.text}")
         return None
 
-def main():
+async def main():
     """Main test function"""
     print("=== Task Scheduler Test ===\n")
-    
-    # Check if server is running
-    try:
-        response = requests.get(f"{BASE_URL}/health")
-        if response.status_code != 200:
-            print("Server is not running. Please start the server first:")
+
+    # One client (and connection pool) is reused for every request below
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        # Check if server is running
+        try:
+            response = await client.get("/health")
+            if response.status_code != 200:
+                print("Server is not running. Please start the server first:")
+                print("python main.py")
+                return
+        except httpx.ConnectError:
+            print("Cannot connect to server. Please start the server first:")
             print("python main.py")
             return
-    except requests.exceptions.ConnectionError:
-        print("Cannot connect to server. Please start the server first:")
-        print("python main.py")
-        return
-    
-    print("Server is running. Starting tests...\n")
-    
-    # Test 1: FIFO Algorithm
-    print("1. Testing FIFO Algorithm")
-    print("-" * 30)
-    
-    jobs = [
-        ("FIFO Job 1", 1, 5, "fifo"),
-        ("FIFO Job 2", 1, 3, "fifo"),
-        ("FIFO Job 3", 1, 7, "fifo"),
-    ]
-    
-    for name, priority, exec_time, algo in jobs:
-        job = create_job(name, priority, exec_time, algo)
-        if job:
-            print(f"Created: {job['name']} (ID: {job['id']})")
-    
-    print("\n2. Testing Priority Algorithm")
-    print("-" * 30)
-    
-    jobs = [
-        ("Priority Job 1", 3, 5, "priority"),
-        ("Priority Job 2", 1, 3, "priority"),  # Higher priority
-        ("Priority Job 3", 5, 7, "priority"),  # Lower priority
-    ]
-    
-    for name, priority, exec_time, algo in jobs:
-        job = create_job(name, priority, exec_time, algo)
-        if job:
-            print(f"Created: {job['name']} (ID: {job['id']}, Priority: {priority})")
-    
-    print("\n3. Testing SJF Algorithm")
-    print("-" * 30)
-    
-    jobs = [
-        ("SJF Job 1", 1, 8, "sjf"),
-        ("SJF Job 2", 1, 2, "sjf"),  # Shortest job
-        ("SJF Job 3", 1, 6, "sjf"),
-    ]
-    
-    for name, priority, exec_time, algo in jobs:
-        job = create_job(name, priority, exec_time, algo)
-        if job:
-            print(f"Created: {job['name']} (ID: {job['id']}, Time: {exec_time}s)")
-    
-    print("\n4. Testing Round Robin Algorithm")
-    print("-" * 30)
-    
-    jobs = [
-        ("RR Job 1", 1, 10, "round_robin"),
-        ("RR Job 2", 1, 5, "round_robin"),
-        ("RR Job 3", 1, 8, "round_robin"),
-    ]
-    
-    for name, priority, exec_time, algo in jobs:
-        job = create_job(name, priority, exec_time, algo)
-        if job:
-            print(f"Created: {job['name']} (ID: {job['id']}, Time: {exec_time}s)")
-    
-    print("\n=== Job Status ===")
-    print("Waiting for jobs to process...")
-    
-    # Monitor jobs for a while
-    for i in range(10):
-        time.sleep(2)
-        status = get_scheduler_status()
-        if status:
-            print(f"Active: {status['active_jobs']}, Pending: {status['pending_jobs']}, "
-                  f"Completed: {status['completed_jobs']}, Failed: {status['failed_jobs']}")
-    
-    print("\n=== Final Job List ===")
-    jobs = get_jobs()
-    for job in jobs:
-        print(f"ID: {job['id']}, Name: {job['name']}, Status: {job['status']}, "
-              f"Algorithm: {job['algorithm']}")
-    
+
+        print("Server is running. Starting tests...\n")
+
+        tests = [
+            ("FIFO", [
+                ("FIFO Job 1", 1, 5, "fifo"),
+                ("FIFO Job 2", 1, 3, "fifo"),
+                ("FIFO Job 3", 1, 7, "fifo"),
+            ]),
+            ("Priority", [
+                ("Priority Job 1", 3, 5, "priority"),
+                ("Priority Job 2", 1, 3, "priority"),  # Higher priority
+                ("Priority Job 3", 5, 7, "priority"),  # Lower priority
+            ]),
+            ("SJF", [
+                ("SJF Job 1", 1, 8, "sjf"),
+                ("SJF Job 2", 1, 2, "sjf"),  # Shortest job
+                ("SJF Job 3", 1, 6, "sjf"),
+            ]),
+            ("Round Robin", [
+                ("RR Job 1", 1, 10, "round_robin"),
+                ("RR Job 2", 1, 5, "round_robin"),
+                ("RR Job 3", 1, 8, "round_robin"),
+            ]),
+        ]
+
+        # Submit every algorithm's batch concurrently; each batch keeps its own arrival order
+        results = await asyncio.gather(*[create_jobs(client, jobs) for _, jobs in tests])
+
+        for i, ((algorithm, _), created) in enumerate(zip(tests, results), start=1):
+            print(f"{i}. Testing {algorithm} Algorithm")
+            print("-" * 30)
+            for job in created:
+                print(f"Created: {job['name']} (ID: {job['id']}, Priority: {job['priority']}, "
+                      f"Time: {job['execution_time']}s)")
+            print()
+
+        print("=== Job Status ===")
+        print("Waiting for jobs to process...")
+
+        # Monitor jobs for a while
+        for i in range(10):
+            await asyncio.sleep(2)
+            status = await get_scheduler_status(client)
+            if status:
+                print(f"Active: {status['active_jobs']}, Pending: {status['pending_jobs']}, "
+                      f"Completed: {status['completed_jobs']}, Failed: {status['failed_jobs']}")
+
+        print("\n=== Final Job List ===")
+        jobs = await get_jobs(client)
+        for job in jobs:
+            print(f"ID: {job['id']}, Name: {job['name']}, Status: {job['status']}, "
+                  f"Algorithm: {job['algorithm']}")
+
     print("\nTest completed!")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())